@@ -0,0 +1,41 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
+_listener = None
+
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """
+    Route all log records through a queue to a background stdout writer.
+
+    Logging threads only enqueue records; formatting and writing happen on
+    the listener thread, which is stopped (and flushed) at interpreter exit.
+    Calling it again returns the existing listener without adding handlers.
+
+    Returns:
+        logging.handlers.QueueListener: The running listener
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    )
+
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.DEBUG)
+
+    listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    _listener = listener
+    return listener
@@ -1,18 +1,13 @@
+import atexit
 import logging
-import requests
-import sys
+from concurrent.futures import ThreadPoolExecutor, wait
+from log_setup import setup_logging
 from tor.proxy import TorProxy
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
 
-
-def get_ip_info(proxy_url, logger):
+def get_ip_info(session, proxy_url, logger):
     try:
-        response = requests.get(
+        response = session.get(
             "https://api.ipify.org?format=json",
             proxies={"http": proxy_url, "https": proxy_url},
             timeout=30,
@@ -20,10 +15,10 @@ def get_ip_info(proxy_url, logger):
         if response.status_code == 200:
             return response.json()
         else:
-            logger.error(f"Failed to get IP info. Status code: {response.status_code}")
+            logger.error("Failed to get IP info. Status code: %s", response.status_code)
             return None
     except Exception as e:
-        logger.error(f"Error fetching IP info: {e}")
+        logger.error("Error fetching IP info: %s", e)
         return None
 
 
@@ -33,16 +28,27 @@ def main():
     logger = logging.getLogger(__name__)
     logger.info("Starting Tor proxy test")
 
-    with TorProxy(tor_path) as proxy:
-        logger.info(f"Tor proxy started at {proxy.socks_addr}")
+    import requests
+    from requests.adapters import HTTPAdapter
 
-        logger.info("Checking initial IP address...")
-        initial_ip_info = get_ip_info(proxy.socks_addr, logger)
-        logger.info(f"Initial IP: {initial_ip_info.get('ip', 'Unknown')}")
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    atexit.register(session.close)
+
+    with TorProxy(tor_path) as proxy:
+        logger.info("Tor proxy started at %s", proxy.socks_addr)
 
-        logger.info("Checking new IP address...")
-        new_ip_info = get_ip_info(proxy.socks_addr, logger)
-        logger.info(f"New IP: {new_ip_info.get('ip', 'Unknown')}")
+        logger.info("Checking initial and new IP address...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            initial_future = executor.submit(
+                get_ip_info, session, proxy.socks_addr, logger
+            )
+            new_future = executor.submit(get_ip_info, session, proxy.socks_addr, logger)
+            wait([initial_future, new_future])
+        initial_ip_info = initial_future.result()
+        new_ip_info = new_future.result()
+        logger.info("Initial IP: %s", (initial_ip_info or {}).get("ip", "Unknown"))
+        logger.info("New IP: %s", (new_ip_info or {}).get("ip", "Unknown"))
 
         if initial_ip_info and new_ip_info:
             initial_ip = initial_ip_info.get("ip")
@@ -50,7 +56,7 @@ def main():
 
             if initial_ip != new_ip:
                 logger.info("SUCCESS: IP address changed after circuit renewal")
-                logger.info(f"Initial IP: {initial_ip} → New IP: {new_ip}")
+                logger.info("Initial IP: %s → New IP: %s", initial_ip, new_ip)
             else:
                 logger.warning(
                     "WARNING: IP address did not change after circuit renewal"
@@ -60,4 +66,5 @@ def main():
 
 
 if __name__ == "__main__":
+    setup_logging()
     main()
\ No newline at end of file
@@ -1,14 +1,40 @@
+import json
 import logging
+import os
+import pathlib
 import sys
+from log_setup import setup_logging
 from tor.proxy import TorProxy
-from playwright.sync_api import sync_playwright
 import time
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
+
+def _firefox_installed(env, driver_cli) -> bool:
+    # the exact revision this playwright version expects, from the driver package
+    manifest = json.loads(
+        (pathlib.Path(driver_cli).parent / "browsers.json").read_text("utf-8")
+    )
+    firefox = next(b for b in manifest["browsers"] if b["name"] == "firefox")
+    if "revisionOverrides" in firefox:
+        # platform specific revisions, let the installer decide
+        return False
+
+    browsers_path = env.get("PLAYWRIGHT_BROWSERS_PATH")
+    if browsers_path == "0":
+        # browsers live inside the playwright package, let the installer decide
+        return False
+    if not browsers_path:
+        if sys.platform == "win32":
+            base = pathlib.Path(os.environ["LOCALAPPDATA"])
+        elif sys.platform == "darwin":
+            base = pathlib.Path.home() / "Library" / "Caches"
+        else:
+            base = pathlib.Path(
+                os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+            )
+        browsers_path = base / "ms-playwright"
+    install_dir = pathlib.Path(browsers_path) / f"firefox-{firefox['revision']}"
+    # written by the installer only after a download finished successfully
+    return (install_dir / "INSTALLATION_COMPLETE").exists()
 
 
 def ensure_browsers_installed(logger):
@@ -19,10 +45,18 @@ def ensure_browsers_installed(logger):
             get_driver_env,
         )
 
+        env = get_driver_env()
         driver_executable, driver_cli = compute_driver_executable()
+        try:
+            if _firefox_installed(env, driver_cli):
+                logger.debug("Firefox already installed, skipping install")
+                return
+        except Exception as e:
+            logger.debug("Could not check Firefox install state: %s", e)
+
         subprocess.run(
             [driver_executable, driver_cli, "install", "firefox"],
-            env=get_driver_env(),
+            env=env,
             check=True,
         )
     except Exception as e:
@@ -33,6 +67,7 @@ def ensure_browsers_installed(logger):
 def main():
     logger = logging.getLogger(__name__)
     ensure_browsers_installed(logger)
+    from playwright.sync_api import sync_playwright
 
     tor_path = r"D:\_app\Tor Browser\Browser\TorBrowser\Tor\tor.exe"
     logger.info("Starting Tor proxy test")
@@ -47,19 +82,26 @@ def main():
             )
 
             logger.info("Browser launched, opening page")
-            page1 = browser.new_page()
+            context = browser.new_context()
+            page1, page2 = context.new_page(), context.new_page()
             page1.goto("https://check.torproject.org/")
-            page2 = browser.new_page()
             page2.goto("https://check.torproject.org/")
 
-            logger.info("Page loaded, waiting for 10 seconds")
-            time.sleep(10)  # some time to interact with the browser
+            if os.environ.get("TOR_RUNNER_INTERACTIVE"):
+                logger.info("Page loaded, waiting for 10 seconds")
+                time.sleep(10)  # some time to interact with the browser
+            else:
+                logger.info("Waiting for pages to settle")
+                for page in (page1, page2):
+                    page.wait_for_load_state("networkidle", timeout=15000)
 
             logger.info("Closing browser")
             page1.close()
             page2.close()
+            context.close()
             browser.close()
 
 
 if __name__ == "__main__":
+    setup_logging()
     main()
@@ -1,12 +1,23 @@
 import subprocess
+import asyncio
+import io
+import os
+import re
+import signal
+import sys
 import tempfile
 import pathlib
 import socket
 import atexit
-import time
 import logging
 import threading
 
+# Tor output lines worth forwarding to the logger, everything else is dropped
+_LOG_FILTER = re.compile(rb"\[(err|warn)\]|Bootstrapped")
+_BOOTSTRAPPED = b"Bootstrapped 100%"
+# Tor log severities from most to least verbose
+_SEVERITIES = ("debug", "info", "notice", "warn", "err")
+
 
 def _free_port() -> int:
     """
@@ -15,11 +26,36 @@ def _free_port() -> int:
     Returns:
         int: A port number that is currently available.
     """
-    sock = socket.socket()
-    sock.bind(("127.0.0.1", 0))
-    port = sock.getsockname()[1]
-    sock.close()
-    return port
+    with socket.socket() as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _logs_bootstrap(log_option) -> bool:
+    """
+    Check whether a Tor Log option sends notice messages to stdout.
+
+    Args:
+        log_option: The value of Tor's Log option, e.g. "info stdout" or
+            "notice-err stdout"
+
+    Returns:
+        bool: True if the bootstrap notices used for readiness reach stdout
+    """
+    parts = str(log_option).lower().split()
+    if len(parts) != 2 or parts[1] != "stdout":
+        return False
+    low, _, high = parts[0].partition("-")
+    try:
+        return (
+            _SEVERITIES.index(low)
+            <= _SEVERITIES.index("notice")
+            <= _SEVERITIES.index(high or "err")
+        )
+    except ValueError:
+        # domain selectors or unknown severities, can't tell
+        return False
 
 
 class TorProxy:
@@ -51,7 +87,12 @@ class TorProxy:
             socks_port: Port for the SOCKS proxy (random if None)
             ctrl_port: Port for the control interface (random if None)
             logger: Custom logger instance (creates one if None)
-            **spawn_kwargs: Additional arguments to pass to Tor as command line options
+            **spawn_kwargs: Additional arguments to pass to Tor as command line options.
+                Unless a Log option is given, Log="notice stdout" (Tor's own default)
+                is passed explicitly so a Log setting in a torrc cannot hide the
+                bootstrap notice used to detect readiness. Pass e.g.
+                Log="info stdout" for more detailed output; a Log value that
+                keeps notices off stdout is logged as a warning.
 
         Raises:
             FileNotFoundError: If the Tor executable does not exist
@@ -59,50 +100,59 @@ class TorProxy:
         self.logger = logger or logging.getLogger(__name__)
         self.tor_path = pathlib.Path(tor_exe_path)
         if not self.tor_path.exists():
-            self.logger.error(f"Tor executable not found at {self.tor_path}")
+            self.logger.error("Tor executable not found at %s", self.tor_path)
             raise FileNotFoundError(f"Tor executable not found at {self.tor_path}")
+        self._tor_path_str = str(self.tor_path)
 
         self.socks_port = socks_port or _free_port()
+        self._socks_addr = f"socks5://127.0.0.1:{self.socks_port}"
         self.ctrl_port = ctrl_port or _free_port()
         self.spawn_kwargs = spawn_kwargs
         self.logger.info(
-            f"TorProxy initialized with SOCKS port {self.socks_port} and control port {self.ctrl_port}"
+            "TorProxy initialized with SOCKS port %d and control port %d",
+            self.socks_port,
+            self.ctrl_port,
         )
 
         self.process = None
+        self._stdout = None
+        self._log_thread = None
+        self._ready = threading.Event()
+        self._bootstrapped = False
+        self._async_process = None
+        self._async_ready = None
+        self._drain_task = None
+        self._cleanup_lock = threading.Lock()
+        self._atexit_registered = False
 
     def __enter__(self):
         """
         Start the Tor process when entering the context manager.
 
-        This method starts Tor, waits for it to be ready, and sets up logging.
+        This method starts Tor, waits for it to finish bootstrapping, and sets up logging.
 
         Returns:
             self: The TorProxy instance
 
         Raises:
-            RuntimeError: If Tor fails to start within the timeout period
+            RuntimeError: If Tor fails to bootstrap within the timeout period
         """
         self.logger.info("Starting Tor process")
-        cmd = [
-            str(self.tor_path),
-            f"--SocksPort",
-            f"{self.socks_port}",
-            f"--ControlPort",
-            f"{self.ctrl_port}",
-            f"--DataDirectory",
-            str(pathlib.Path(tempfile.mkdtemp(prefix="tor_data_"))),
-        ]
-        if self.spawn_kwargs:
-            for key, value in self.spawn_kwargs.items():
-                cmd.append(f"--{key}")
-                cmd.append(str(value))
-
-        self.logger.debug(f"Tor command: {' '.join(cmd)}")
-
-        self.process = subprocess.Popen(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
-        )
+        self._ready.clear()
+        self._bootstrapped = False
+        cmd = self._build_cmd()
+
+        read_fd, write_fd = os.pipe()
+        try:
+            self.process = subprocess.Popen(
+                cmd, stdout=write_fd, stderr=subprocess.STDOUT, **self._popen_kwargs()
+            )
+        except BaseException:
+            os.close(read_fd)
+            raise
+        finally:
+            os.close(write_fd)
+        self._stdout = io.BufferedReader(io.FileIO(read_fd, "rb"), buffer_size=8192)
 
         self._stop_logging = False
         self._log_thread = threading.Thread(
@@ -110,23 +160,23 @@ class TorProxy:
         )
         self._log_thread.start()
 
-        atexit.register(self.cleanup)
+        if not self._atexit_registered:
+            atexit.register(self.cleanup)
+            self._atexit_registered = True
         self.logger.debug("Tor process started, waiting for it to be ready")
 
-        deadline = time.time() + 30
-        while time.time() < deadline:
-            try:
-                s = socket.create_connection(("127.0.0.1", self.socks_port), 1)
-                s.close()
-                self.logger.info(
-                    f"Tor successfully started and listening on port {self.socks_port}"
-                )
-                break
-            except OSError:
-                time.sleep(0.2)
-        else:
+        if not self._ready.wait(30):
             self.logger.error("Timeout while waiting for Tor to start")
-            raise RuntimeError("Tor failed to start within 30 s")
+            self.cleanup()
+            raise RuntimeError("Tor failed to bootstrap within 30 s")
+        if not self._bootstrapped:
+            self.logger.error("Tor exited before it finished bootstrapping")
+            returncode = self._exit_code(self.process)
+            self.cleanup()
+            raise RuntimeError(f"Tor exited during startup with code {returncode}")
+        self.logger.info(
+            "Tor successfully started and listening on port %d", self.socks_port
+        )
         return self
 
     def __exit__(self, exc_type, exc, tb):
@@ -143,6 +193,71 @@ class TorProxy:
         self.logger.info("Exiting Tor proxy context")
         self.cleanup()
 
+    async def __aenter__(self):
+        """
+        Start the Tor process when entering an async context manager.
+
+        Behaves like __enter__, but runs Tor as an asyncio subprocess whose
+        output is drained by a task on the running event loop instead of a
+        separate thread.
+
+        Unlike __enter__, no atexit hook is registered because cleanup has to
+        run on the event loop. Leave the context through __aexit__ (task
+        cancellation does this); if the loop is torn down without it, Tor is
+        only stopped when asyncio closes the subprocess transport.
+
+        Returns:
+            self: The TorProxy instance
+
+        Raises:
+            RuntimeError: If Tor fails to bootstrap within the timeout period
+        """
+        self.logger.info("Starting Tor process")
+        self._bootstrapped = False
+        self._async_ready = asyncio.Event()
+        cmd = self._build_cmd()
+
+        self._async_process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            **self._popen_kwargs(),
+        )
+        self._drain_task = asyncio.create_task(self._drain_process_output())
+        self.logger.debug("Tor process started, waiting for it to be ready")
+
+        try:
+            await asyncio.wait_for(self._async_ready.wait(), 30)
+        except asyncio.TimeoutError:
+            self.logger.error("Timeout while waiting for Tor to start")
+            await self.acleanup()
+            raise RuntimeError("Tor failed to bootstrap within 30 s") from None
+        except BaseException:
+            # cancelled or interrupted; __aexit__ won't run, so stop Tor here
+            await asyncio.shield(self.acleanup())
+            raise
+        if not self._bootstrapped:
+            self.logger.error("Tor exited before it finished bootstrapping")
+            returncode = await self._async_exit_code(self._async_process)
+            await self.acleanup()
+            raise RuntimeError(f"Tor exited during startup with code {returncode}")
+        self.logger.info(
+            "Tor successfully started and listening on port %d", self.socks_port
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """
+        Clean up resources when exiting the async context manager.
+
+        Args:
+            exc_type: The exception type if an exception was raised
+            exc: The exception instance if an exception was raised
+            tb: The traceback if an exception was raised
+        """
+        self.logger.info("Exiting Tor proxy context")
+        await self.acleanup()
+
     @property
     def socks_addr(self) -> str:
         """
@@ -151,7 +266,117 @@ class TorProxy:
         Returns:
             str: The SOCKS5 proxy URL in the format 'socks5://127.0.0.1:port'
         """
-        return f"socks5://127.0.0.1:{self.socks_port}"
+        return self._socks_addr
+
+    def _build_cmd(self) -> list[str]:
+        """
+        Build the Tor command line for a fresh data directory.
+
+        Returns:
+            list[str]: The executable followed by its command line options
+        """
+        cmd = [
+            self._tor_path_str,
+            f"--SocksPort",
+            f"{self.socks_port}",
+            f"--ControlPort",
+            f"{self.ctrl_port}",
+            f"--DataDirectory",
+            tempfile.mkdtemp(prefix="tor_data_"),
+            *(
+                arg
+                for key, value in self.spawn_kwargs.items()
+                for arg in (f"--{key}", str(value))
+            ),
+        ]
+        # Tor option names are case-insensitive
+        log_key = next((k for k in self.spawn_kwargs if k.lower() == "log"), None)
+        if log_key is None:
+            # Tor's default, but overrides a torrc Log that would hide bootstrap
+            cmd += ["--Log", "notice stdout"]
+        elif not _logs_bootstrap(self.spawn_kwargs[log_key]):
+            self.logger.warning(
+                "Log option %r may hide the 'Bootstrapped 100%%' notice on stdout "
+                "that readiness is detected from, startup can time out",
+                self.spawn_kwargs[log_key],
+            )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Tor command: %s", " ".join(cmd))
+        return cmd
+
+    @staticmethod
+    def _popen_kwargs() -> dict:
+        """
+        Platform specific keyword arguments for spawning Tor.
+
+        Returns:
+            dict: Extra arguments for subprocess.Popen or create_subprocess_exec
+        """
+        if sys.platform == "win32":
+            # own process group so CTRL_BREAK_EVENT only reaches Tor
+            return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+        return {}
+
+    @staticmethod
+    def _request_exit(process):
+        """
+        Ask Tor to shut down, gracefully where the platform allows it.
+
+        Args:
+            process: A subprocess.Popen or asyncio.subprocess.Process
+        """
+        if sys.platform == "win32":
+            try:
+                process.send_signal(signal.CTRL_BREAK_EVENT)
+                return
+            except OSError:
+                # no console attached, e.g. under pythonw or as a service
+                pass
+        process.terminate()
+
+    @staticmethod
+    def _exit_code(process, timeout: float = 1) -> int | None:
+        """
+        Wait briefly for an exiting Tor process to be reaped.
+
+        Args:
+            process: The subprocess.Popen running Tor
+            timeout: Seconds to wait before giving up
+
+        Returns:
+            int | None: The exit code, or None if Tor is still running
+        """
+        try:
+            return process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return None
+
+    @staticmethod
+    async def _async_exit_code(process, timeout: float = 1) -> int | None:
+        """
+        Async counterpart of _exit_code for an asyncio.subprocess.Process.
+        """
+        try:
+            return await asyncio.wait_for(process.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def _handle_output_line(self, line: bytes) -> bool:
+        """
+        Log a single line of Tor output if it matches _LOG_FILTER.
+
+        Args:
+            line: The raw output line, including its line ending
+
+        Returns:
+            bool: True if the line reports that bootstrapping has completed
+        """
+        if _LOG_FILTER.search(line) and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(line.decode("utf-8", errors="replace").rstrip())
+        if _BOOTSTRAPPED in line:
+            self._bootstrapped = True
+            return True
+        return False
 
     def _log_process_output(self):
         """
@@ -159,42 +384,130 @@ class TorProxy:
 
         This method runs in a separate thread to consume and log the
         output from the Tor process until the process terminates or
-        _stop_logging is set to True.
+        _stop_logging is set to True. It also signals readiness once
+        Tor reports that bootstrapping has completed, and wakes up
+        __enter__ early if the output ends before that happens.
+
+        Output is read as bytes; only lines matching _LOG_FILTER are
+        decoded and passed to the logger.
         """
-        if not self.process:
+        process, stdout = self.process, self._stdout
+        if not process:
             return
 
-        while not self._stop_logging and self.process.poll() is None:
-            line = self.process.stdout.readline()
-            if line:
-                line = line.strip()
-                if line:
-                    self.logger.debug(line)
-            else:
-                time.sleep(0.1)
+        try:
+            # the reader owns the pipe: closing it from another thread while a
+            # read is blocked would wait on the buffer lock indefinitely
+            with stdout:
+                for line in stdout:
+                    if self._stop_logging:
+                        break
+                    if self._handle_output_line(line):
+                        self._ready.set()
+
+            if not self._stop_logging:
+                self.logger.debug(
+                    "Tor output closed, process exit code: %s",
+                    self._exit_code(process),
+                )
+        finally:
+            # EOF, shutdown or error, don't leave __enter__ waiting for the timeout
+            self._ready.set()
 
     def cleanup(self):
         """
         Clean up resources associated with the Tor process.
 
         This method stops the logging thread and terminates the Tor process
-        gracefully if possible, or forcefully if necessary.
+        gracefully if possible, or forcefully if necessary. It is safe to call
+        more than once and from multiple threads.
         """
-        self._stop_logging = True
-        if self._log_thread and self._log_thread.is_alive():
-            self._log_thread.join(timeout=1)
+        with self._cleanup_lock:
+            if self.process is None:
+                return
+
+            self._stop_logging = True
+
+            if self.process.poll() is None:
+                self.logger.info("Terminating Tor process")
+                self._request_exit(self.process)
+                try:
+                    self.process.wait(timeout=2)
+                    self.logger.debug("Tor process terminated gracefully")
+                except subprocess.TimeoutExpired:
+                    self.logger.warning(
+                        "Tor process did not terminate gracefully, killing it"
+                    )
+                    self.process.kill()
+
+            # the pipe reaches EOF once Tor has exited, which ends the log thread
+            # and closes the pipe; a child holding it open only delays that
+            if self._log_thread and self._log_thread.is_alive():
+                self._log_thread.join(timeout=1)
+            self._stdout = None
 
-        if self.process and self.process.poll() is None:
+            self.process = None
+            self.logger.info("Tor process cleanup completed")
+
+    async def _drain_process_output(self):
+        """
+        Read and log the output of the asyncio Tor process until EOF.
+
+        Async counterpart of _log_process_output, run as a task on the
+        event loop that entered the context manager.
+        """
+        process = self._async_process
+        try:
+            while True:
+                try:
+                    line = await process.stdout.readline()
+                except ValueError:
+                    # longer than the StreamReader limit; it has been discarded,
+                    # keep draining so Tor never blocks on a full pipe
+                    self.logger.debug("Skipped over-long line of Tor output")
+                    continue
+                if not line:
+                    break
+                if self._handle_output_line(line):
+                    self._async_ready.set()
+
+            self.logger.debug(
+                "Tor output closed, process exit code: %s",
+                await self._async_exit_code(process),
+            )
+        finally:
+            # EOF or error, don't leave __aenter__ waiting for the full timeout
+            self._async_ready.set()
+
+    async def acleanup(self):
+        """
+        Clean up resources associated with an asyncio Tor process.
+
+        Async counterpart of cleanup. It is safe to call more than once.
+        """
+        process, self._async_process = self._async_process, None
+        if process is None:
+            return
+
+        if process.returncode is None:
             self.logger.info("Terminating Tor process")
-            self.process.terminate()
+            self._request_exit(process)
             try:
-                self.process.wait(timeout=5)
+                await asyncio.wait_for(process.wait(), 2)
                 self.logger.debug("Tor process terminated gracefully")
-            except subprocess.TimeoutExpired:
+            except asyncio.TimeoutError:
                 self.logger.warning(
                     "Tor process did not terminate gracefully, killing it"
                 )
-                self.process.kill()
-        if self.process:
-            self.process = None
-            self.logger.info("Tor process cleanup completed")
+                process.kill()
+                await process.wait()
+
+        # the pipe reaches EOF once Tor has exited, which ends the drain task
+        try:
+            await asyncio.wait_for(self._drain_task, 1)
+        except asyncio.TimeoutError:
+            pass
+        except Exception as e:
+            self.logger.warning("Reading Tor output failed: %s", e)
+        self._drain_task = None
+        self.logger.info("Tor process cleanup completed")